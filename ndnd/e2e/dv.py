@@ -1,9 +1,10 @@
 import json
 import subprocess
-import shutil
 
 from minindn.apps.application import Application
 
+from fw import ndnd_installed
+
 DEFAULT_NETWORK = '/minindn'
 
 TRUST_ROOT_NAME: str = None
@@ -17,7 +18,7 @@ class NDNd_DV(Application):
         Application.__init__(self, node)
         self.network = network
 
-        if not shutil.which('ndnd'):
+        if not ndnd_installed():
             raise Exception('ndnd not found in PATH, did you install it?')
 
         if TRUST_ROOT_NAME is None:
@@ -1,3 +1,6 @@
+import errno
+import selectors
+import socket
 import time
 
 from mininet.log import info
@@ -9,12 +12,45 @@ from minindn.apps.app_manager import AppManager
 from dv import NDNd_DV, DEFAULT_NETWORK
 
 def setup(ndn: Minindn, network=DEFAULT_NETWORK) -> None:
-    time.sleep(1) # wait for fw to start
+    wait_fw_ready(ndn.net.hosts)
 
     NDNd_DV.init_trust()
     info('Starting ndn-dv on nodes\n')
     AppManager(ndn, ndn.net.hosts, NDNd_DV, network=network)
 
+def wait_fw_ready(nodes: list[Node], deadline=10) -> None:
+    """
+    Wait until the forwarder on every node accepts connections on its
+    unix socket. The socket file can exist before the forwarder listens,
+    so only a completed connect counts as ready.
+    """
+    info('Waiting for forwarders to start\n')
+    pending = {node.name: f'/run/nfd/{node.name}.sock' for node in nodes}
+    start = time.time()
+    while time.time() - start < deadline:
+        with selectors.DefaultSelector() as sel:
+            for name, path in pending.items():
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                err = sock.connect_ex(path)
+                if err in (0, errno.EAGAIN, errno.EINPROGRESS):
+                    sel.register(sock, selectors.EVENT_WRITE, name)
+                else:
+                    sock.close()
+
+            for key, _ in sel.select(timeout=0.1):
+                if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    del pending[key.data]
+
+            for key in list(sel.get_map().values()):
+                key.fileobj.close()
+
+        if not pending:
+            return
+        time.sleep(0.1)
+
+    raise Exception(f'Forwarder did not start on {", ".join(pending)}')
+
 def converge(nodes: list[Node], deadline=30, network=DEFAULT_NETWORK, use_nfdc=False) -> int:
     info('Waiting for routing to converge\n')
     start = time.time()
@@ -1,14 +1,20 @@
+import functools
 import json
 import os
 import shutil
 
 from minindn.apps.application import Application
 
+@functools.cache
+def ndnd_installed() -> bool:
+    # Looked up once per process; every node constructs its own app instance
+    return shutil.which('ndnd') is not None
+
 class NDNd_FW(Application):
     def __init__(self, node, config={}, logLevel='INFO', threads=2):
         Application.__init__(self, node)
 
-        if not shutil.which('ndnd'):
+        if not ndnd_installed():
             raise Exception('ndnd not found in PATH, did you install it?')
 
         self.logFile = 'yanfd.log'